@@ -6,15 +6,22 @@ This server provides tools to interact with ISPW (Interactive Source Program Wor
 a source code management, release automation, and deployment automation tool for mainframe DevOps.
 """
 
+import asyncio
+import functools
 import json
 import os
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple
 
 import httpx
 from mcp.server.fastmcp import FastMCP
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib encoder
+    orjson = None
 
 # Initialize the MCP server
 mcp = FastMCP("ispw_mcp")
@@ -27,6 +34,30 @@ ISPW_API_TOKEN = os.getenv("ISPW_API_TOKEN", "")
 ISPW_DEFAULT_SRID = os.getenv("ISPW_DEFAULT_SRID", "ISPW")
 ISPW_TIMEOUT = int(os.getenv("ISPW_TIMEOUT", "30"))
 
+# Static request headers, computed once at import
+_AUTH_HEADER = f"Bearer {ISPW_API_TOKEN}"
+_BASE_HEADERS = {
+    "Authorization": _AUTH_HEADER,
+    "Accept": "application/json",
+    "Accept-Encoding": "br, gzip"
+}
+# Sent only with requests that carry a JSON body
+_JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
+
+# List responses with more records than this are formatted in a worker thread, so a
+# large markdown rendering does not block other tool calls on the event loop. Inline
+# formatting costs roughly 1ms per 1000 records, so below this the thread hop costs
+# more than the blocking it saves.
+_OFFLOAD_THRESHOLD = 10_000
+
+# Maximum task lookups a batch runs against the ISPW server at the same time
+_BATCH_CONCURRENCY = 8
+
+# Shared HTTP client, created lazily by _get_client()
+_client: Optional[httpx.AsyncClient] = None
+# Batch concurrency limiter, created lazily by _get_batch_semaphore() and reset with the client
+_batch_semaphore: Optional[asyncio.Semaphore] = None
+
 # Enums
 class ResponseFormat(str, Enum):
     """Output format for tool responses."""
@@ -57,67 +88,224 @@ class OperationStatus(str, Enum):
     FAILED = "FAILED"
 
 
+# Identifier field types; surrounding whitespace is stripped from user-supplied IDs
+_Srid = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=50)]
+_Identifier = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=100)]
+_IdentifierFilter = Annotated[str, StringConstraints(strip_whitespace=True, max_length=100)]
+
+
+class _IspwBase(BaseModel):
+    """Fields and configuration shared by all tool input models."""
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    srid: _Srid = Field(
+        default=ISPW_DEFAULT_SRID,
+        description="System Resource Identifier (e.g., 'ISPW', 'PROD')"
+    )
+    response_format: ResponseFormat = Field(
+        default=ResponseFormat.MARKDOWN,
+        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
+    )
+
+
 # Shared utility functions
+def _dump_json(data: Any) -> str:
+    """Serialize API data for the JSON response format."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC).decode()
+    return json.dumps(data, indent=2)
+
+
+def _encode_json(data: Any) -> bytes:
+    """Encode a request body as compact JSON."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _load_json(content: bytes) -> Any:
+    """Parse a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps connections (and their TLS sessions) alive across tool calls.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=ISPW_BASE_URL,
+            verify=False,  # SSL verification may vary for CES
+            http2=True,
+            timeout=httpx.Timeout(ISPW_TIMEOUT),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0),
+            headers=_BASE_HEADERS
+        )
+    return _client
+
+
+async def _close_client() -> None:
+    """Close the shared HTTP client and release its connections."""
+    global _client, _batch_semaphore
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    _batch_semaphore = None
+
+
+def _get_batch_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore that caps concurrent batch requests, creating it if needed."""
+    global _batch_semaphore
+    if _batch_semaphore is None:
+        _batch_semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+    return _batch_semaphore
+
+
+@functools.lru_cache(maxsize=64)
+def _assignments_url(srid: str) -> str:
+    """Return the assignments collection endpoint for an SRID."""
+    return f"ispw/{srid}/assignments"
+
+
+@functools.lru_cache(maxsize=64)
+def _releases_url(srid: str) -> str:
+    """Return the releases collection endpoint for an SRID."""
+    return f"ispw/{srid}/releases"
+
+
+@functools.lru_cache(maxsize=64)
+def _sets_url(srid: str) -> str:
+    """Return the sets collection endpoint for an SRID."""
+    return f"ispw/{srid}/sets"
+
+
+@functools.lru_cache(maxsize=64)
+def _packages_url(srid: str) -> str:
+    """Return the packages collection endpoint for an SRID."""
+    return f"ispw/{srid}/packages"
+
+
+# Collection endpoint builder for each deploy target_type
+_DEPLOY_ENDPOINTS = {
+    "assignment": _assignments_url,
+    "release": _releases_url,
+    "set": _sets_url
+}
+
+
 async def _make_api_request(
     endpoint: str,
     method: str = "GET",
     json_data: Optional[Dict[str, Any]] = None,
-    params: Optional[Dict[str, Any]] = None
-) -> Dict[str, Any]:
-    """Reusable function for all ISPW API calls."""
+    params: Optional[Dict[str, Any]] = None,
+    raw: bool = False
+) -> Tuple[Any, Optional[str]]:
+    """Reusable function for all ISPW API calls.
+
+    Returns a (data, error) pair. Non-2xx responses are reported as a formatted error
+    message rather than raised; network errors and a missing token still raise. With
+    raw=True, data is the response body text, passed through without parsing.
+    """
     if not ISPW_API_TOKEN:
         raise ValueError("ISPW_API_TOKEN environment variable not set")
 
-    headers = {
-        "Authorization": f"Bearer {ISPW_API_TOKEN}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
+    if json_data is not None:
+        content, headers = _encode_json(json_data), _JSON_CONTENT_HEADERS
+    else:
+        content, headers = None, None
+
+    response = await _get_client().request(
+        method,
+        endpoint,
+        content=content,
+        headers=headers,
+        params=params
+    )
+    if not response.is_success:
+        return None, _format_status_error(response)
+    if raw:
+        return response.text, None
+    return _load_json(response.content), None
 
-    url = f"{ISPW_BASE_URL}/{endpoint}"
 
-    async with httpx.AsyncClient(verify=False) as client:  # SSL verification may vary for CES
-        response = await client.request(
-            method,
-            url,
-            headers=headers,
-            json=json_data,
-            params=params,
-            timeout=ISPW_TIMEOUT
-        )
-        response.raise_for_status()
-        return response.json()
+async def _make_api_requests_batch(specs: List[Dict[str, Any]]) -> List[Any]:
+    """Run several ISPW API calls concurrently.
+
+    Each spec holds the keyword arguments for one _make_api_request call. At most
+    _BATCH_CONCURRENCY calls are in flight at once. Results are returned in the same
+    order as (data, error) pairs; a call that raised yields its exception instead.
+    """
+    semaphore = _get_batch_semaphore()
 
+    async def run(spec: Dict[str, Any]) -> Tuple[Any, Optional[str]]:
+        async with semaphore:
+            return await _make_api_request(**spec)
 
+    return await asyncio.gather(*(run(spec) for spec in specs), return_exceptions=True)
+
+
+# Errors a tool reports to the caller as a message; anything else is a bug and propagates
+_API_ERRORS = (httpx.HTTPError, ValueError)
+
+# Fixed error messages for common ISPW API status codes
+_STATUS_ERROR_MESSAGES = {
+    401: "Error: Authentication failed. Check your ISPW_API_TOKEN is valid.",
+    403: "Error: Permission denied. You don't have access to this resource.",
+    404: "Error: Resource not found. Verify the SRID, assignment ID, release ID, or other identifiers.",
+    429: "Error: Rate limit exceeded. Please wait before making more requests."
+}
+
+
+def _format_status_error(response: httpx.Response) -> str:
+    """Format an error message for a non-2xx ISPW API response."""
+    message = _STATUS_ERROR_MESSAGES.get(response.status_code)
+    if message:
+        return message
+    if response.status_code == 400:
+        try:
+            error_detail = _load_json(response.content)
+            return f"Error: Bad request - {error_detail.get('error', {}).get('message', 'Invalid parameters')}"
+        except Exception:
+            return "Error: Bad request. Check your input parameters."
+    return f"Error: API request failed with status {response.status_code}"
+
+
+@functools.singledispatch
 def _handle_api_error(e: Exception) -> str:
-    """Consistent error formatting across all tools."""
-    if isinstance(e, httpx.HTTPStatusError):
-        if e.response.status_code == 401:
-            return "Error: Authentication failed. Check your ISPW_API_TOKEN is valid."
-        elif e.response.status_code == 404:
-            return "Error: Resource not found. Verify the SRID, assignment ID, release ID, or other identifiers."
-        elif e.response.status_code == 403:
-            return "Error: Permission denied. You don't have access to this resource."
-        elif e.response.status_code == 400:
-            try:
-                error_detail = e.response.json()
-                return f"Error: Bad request - {error_detail.get('error', {}).get('message', 'Invalid parameters')}"
-            except Exception:
-                return "Error: Bad request. Check your input parameters."
-        elif e.response.status_code == 429:
-            return "Error: Rate limit exceeded. Please wait before making more requests."
-        return f"Error: API request failed with status {e.response.status_code}"
-    elif isinstance(e, httpx.TimeoutException):
-        return "Error: Request timed out. The ISPW server may be slow or unavailable."
-    elif isinstance(e, ValueError) as ve:
-        return f"Error: {str(ve)}"
+    """Consistent error formatting across all tools, dispatched on the exception type."""
     return f"Error: Unexpected error occurred: {type(e).__name__} - {str(e)}"
 
 
-def _format_datetime(dt_str: Optional[str]) -> str:
-    """Format datetime string to human-readable format."""
+@_handle_api_error.register
+def _handle_timeout_error(e: httpx.TimeoutException) -> str:
+    return "Error: Request timed out. The ISPW server may be slow or unavailable."
+
+
+@_handle_api_error.register
+def _handle_value_error(e: ValueError) -> str:
+    return f"Error: {str(e)}"
+
+
+def _format_datetime(dt_str: Any) -> str:
+    """Format datetime string to human-readable format.
+
+    Only strings go through the cache; other values (a dict or list from the server)
+    are unhashable and are echoed back as-is.
+    """
     if not dt_str:
         return "N/A"
+    if isinstance(dt_str, str):
+        return _format_datetime_str(dt_str)
+    return str(dt_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_datetime_str(dt_str: str) -> str:
+    """Format a non-empty datetime string; cached because list responses often repeat timestamps."""
     try:
         dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
         return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
@@ -127,142 +315,156 @@ def _format_datetime(dt_str: Optional[str]) -> str:
 
 def _format_assignment_markdown(assignment: Dict[str, Any]) -> str:
     """Format assignment data as markdown."""
-    lines = [
-        f"## Assignment: {assignment.get('assignmentId', 'N/A')}",
-        f"- **Description**: {assignment.get('description', 'N/A')}",
-        f"- **Owner**: {assignment.get('owner', 'N/A')}",
-        f"- **Stream**: {assignment.get('stream', 'N/A')}",
-        f"- **Application**: {assignment.get('application', 'N/A')}",
-        f"- **Level**: {assignment.get('level', 'N/A')}",
-        f"- **Status**: {assignment.get('status', 'N/A')}",
-        f"- **Created**: {_format_datetime(assignment.get('createdDate'))}",
-        f"- **Modified**: {_format_datetime(assignment.get('modifiedDate'))}",
-        ""
-    ]
-    return "\n".join(lines)
+    g = assignment.get
+    return (
+        f"## Assignment: {g('assignmentId', 'N/A')}\n"
+        f"- **Description**: {g('description', 'N/A')}\n"
+        f"- **Owner**: {g('owner', 'N/A')}\n"
+        f"- **Stream**: {g('stream', 'N/A')}\n"
+        f"- **Application**: {g('application', 'N/A')}\n"
+        f"- **Level**: {g('level', 'N/A')}\n"
+        f"- **Status**: {g('status', 'N/A')}\n"
+        f"- **Created**: {_format_datetime(g('createdDate'))}\n"
+        f"- **Modified**: {_format_datetime(g('modifiedDate'))}\n"
+    )
 
 
 def _format_release_markdown(release: Dict[str, Any]) -> str:
     """Format release data as markdown."""
-    lines = [
-        f"## Release: {release.get('releaseId', 'N/A')}",
-        f"- **Description**: {release.get('description', 'N/A')}",
-        f"- **Owner**: {release.get('owner', 'N/A')}",
-        f"- **Stream**: {release.get('stream', 'N/A')}",
-        f"- **Application**: {release.get('application', 'N/A')}",
-        f"- **Status**: {release.get('status', 'N/A')}",
-        f"- **Created**: {_format_datetime(release.get('createdDate'))}",
-        ""
-    ]
-    return "\n".join(lines)
+    g = release.get
+    return (
+        f"## Release: {g('releaseId', 'N/A')}\n"
+        f"- **Description**: {g('description', 'N/A')}\n"
+        f"- **Owner**: {g('owner', 'N/A')}\n"
+        f"- **Stream**: {g('stream', 'N/A')}\n"
+        f"- **Application**: {g('application', 'N/A')}\n"
+        f"- **Status**: {g('status', 'N/A')}\n"
+        f"- **Created**: {_format_datetime(g('createdDate'))}\n"
+    )
 
 
 def _format_task_markdown(task: Dict[str, Any]) -> str:
     """Format task data as markdown."""
-    lines = [
-        f"### Task: {task.get('taskId', 'N/A')}",
-        f"- **Module**: {task.get('moduleName', 'N/A')} ({task.get('moduleType', 'N/A')})",
-        f"- **Level**: {task.get('level', 'N/A')}",
-        f"- **Status**: {task.get('status', 'N/A')}",
-        f"- **User**: {task.get('userId', 'N/A')}",
-        ""
-    ]
-    return "\n".join(lines)
+    g = task.get
+    return (
+        f"### Task: {g('taskId', 'N/A')}\n"
+        f"- **Module**: {g('moduleName', 'N/A')} ({g('moduleType', 'N/A')})\n"
+        f"- **Level**: {g('level', 'N/A')}\n"
+        f"- **Status**: {g('status', 'N/A')}\n"
+        f"- **User**: {g('userId', 'N/A')}\n"
+    )
+
+
+def _format_set_markdown(set_data: Dict[str, Any]) -> str:
+    """Format set data as markdown."""
+    g = set_data.get
+    return (
+        f"## Set: {g('setId', 'N/A')}\n"
+        f"- **Description**: {g('description', 'N/A')}\n"
+        f"- **Owner**: {g('owner', 'N/A')}\n"
+        f"- **Application**: {g('application', 'N/A')}\n"
+        f"- **Status**: {g('status', 'N/A')}\n"
+    )
+
+
+def _format_package_markdown(package: Dict[str, Any]) -> str:
+    """Format package data as markdown."""
+    g = package.get
+    return (
+        f"## Package: {g('packageId', 'N/A')}\n"
+        f"- **Description**: {g('description', 'N/A')}\n"
+        f"- **Owner**: {g('owner', 'N/A')}\n"
+        f"- **Application**: {g('application', 'N/A')}\n"
+        f"- **Status**: {g('status', 'N/A')}\n"
+        f"- **Created**: {_format_datetime(g('createdDate'))}\n"
+    )
+
+
+# Most calls use the default SRID, so its list headings are built once at import
+_SETS_HEADER_DEFAULT = f"# ISPW Sets for {ISPW_DEFAULT_SRID}\n\n"
+_PACKAGES_HEADER_DEFAULT = f"# ISPW Packages for {ISPW_DEFAULT_SRID}\n\n"
+
+
+def _format_sets_markdown(srid: str, sets: List[Dict[str, Any]], total: int) -> str:
+    """Format a list of sets as a markdown document."""
+    header = _SETS_HEADER_DEFAULT if srid == ISPW_DEFAULT_SRID else f"# ISPW Sets for {srid}\n\n"
+    return header + f"Found {total} set(s)\n\n" + "\n".join(
+        _format_set_markdown(set_data) for set_data in sets
+    )
+
+
+def _format_packages_markdown(srid: str, packages: List[Dict[str, Any]], total: int) -> str:
+    """Format a list of packages as a markdown document."""
+    header = _PACKAGES_HEADER_DEFAULT if srid == ISPW_DEFAULT_SRID else f"# ISPW Packages for {srid}\n\n"
+    return header + f"Found {total} package(s)\n\n" + "\n".join(
+        _format_package_markdown(package) for package in packages
+    )
 
 
 def _format_operation_markdown(operation: Dict[str, Any]) -> str:
     """Format operation response as markdown."""
-    lines = [
-        f"# Operation {operation.get('status', 'UNKNOWN')}",
-        f"- **Operation ID**: {operation.get('operationId', 'N/A')}",
-        f"- **Status**: {operation.get('status', 'N/A')}",
-        f"- **Message**: {operation.get('message', 'N/A')}",
-    ]
-    if operation.get('url'):
-        lines.append(f"- **Status URL**: {operation['url']}")
-    if operation.get('startTime'):
-        lines.append(f"- **Started**: {_format_datetime(operation['startTime'])}")
-    return "\n".join(lines)
+    g = operation.get
+    text = (
+        f"# Operation {g('status', 'UNKNOWN')}\n"
+        f"- **Operation ID**: {g('operationId', 'N/A')}\n"
+        f"- **Status**: {g('status', 'N/A')}\n"
+        f"- **Message**: {g('message', 'N/A')}"
+    )
+    url = g('url')
+    if url:
+        text += f"\n- **Status URL**: {url}"
+    start_time = g('startTime')
+    if start_time:
+        text += f"\n- **Started**: {_format_datetime(start_time)}"
+    return text
+
+
+# Renderers for operation responses, keyed by ResponseFormat. The operation
+# input models use use_enum_values, and ResponseFormat is a str enum, so both
+# the member and its plain value hash to the same key.
+_OPERATION_RENDERERS = {
+    ResponseFormat.MARKDOWN: _format_operation_markdown,
+    ResponseFormat.JSON: _dump_json,
+}
 
 
 # ============================================================================
 # ASSIGNMENT TOOLS
 # ============================================================================
 
-class ListAssignmentsInput(BaseModel):
+class ListAssignmentsInput(_IspwBase):
     """Input model for listing assignments."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier (e.g., 'ISPW', 'PROD')",
-        min_length=1,
-        max_length=50
-    )
     level: Optional[AssignmentLevel] = Field(
         default=None,
         description="Filter by assignment level (DEV, INT, ACC, PRD)"
     )
-    assignment_id: Optional[str] = Field(
+    assignment_id: Optional[_IdentifierFilter] = Field(
         default=None,
-        description="Filter by specific assignment ID",
-        max_length=100
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
+        description="Filter by specific assignment ID"
     )
 
 
-class GetAssignmentInput(BaseModel):
+class GetAssignmentInput(_IspwBase):
     """Input model for getting assignment details."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier",
-        min_length=1,
-        max_length=50
-    )
-    assignment_id: str = Field(
+    assignment_id: _Identifier = Field(
         ...,
-        description="Assignment identifier to retrieve",
-        min_length=1,
-        max_length=100
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format"
+        description="Assignment identifier to retrieve"
     )
 
 
-class CreateAssignmentInput(BaseModel):
+class CreateAssignmentInput(_IspwBase):
     """Input model for creating an assignment."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier",
-        min_length=1,
-        max_length=50
-    )
-    assignment_id: str = Field(
+    assignment_id: _Identifier = Field(
         ...,
-        description="Assignment identifier (must be unique)",
-        min_length=1,
-        max_length=100
+        description="Assignment identifier (must be unique)"
     )
-    stream: str = Field(
+    stream: _Identifier = Field(
         ...,
-        description="Stream name for the assignment",
-        min_length=1,
-        max_length=100
+        description="Stream name for the assignment"
     )
-    application: str = Field(
+    application: _Identifier = Field(
         ...,
-        description="Application name for the assignment",
-        min_length=1,
-        max_length=100
+        description="Application name for the assignment"
     )
     description: Optional[str] = Field(
         default=None,
@@ -274,10 +476,6 @@ class CreateAssignmentInput(BaseModel):
         description="Default path for the assignment",
         max_length=200
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format"
-    )
 
 
 @mcp.tool(
@@ -312,38 +510,40 @@ async def ispw_list_assignments(params: ListAssignmentsInput) -> str:
         - Find specific assignment: srid="ISPW", assignment_id="PLAY000001"
     """
     try:
+        level = params.level.value if params.level else None
         query_params = {}
-        if params.level:
-            query_params["level"] = params.level.value
+        if level:
+            query_params["level"] = level
         if params.assignment_id:
             query_params["assignmentId"] = params.assignment_id
 
-        data = await _make_api_request(
-            f"ispw/{params.srid}/assignments",
-            params=query_params
+        raw = params.response_format is ResponseFormat.JSON
+        data, error = await _make_api_request(
+            _assignments_url(params.srid),
+            params=query_params,
+            raw=raw
         )
+        if error:
+            return error
+
+        if raw:
+            return data
 
         assignments = data.get("assignments", [])
         total = data.get("totalCount", len(assignments))
 
         if not assignments:
-            filter_desc = f" matching filters" if query_params else ""
+            filter_desc = " matching filters" if query_params else ""
             return f"No assignments found{filter_desc} for SRID '{params.srid}'"
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [f"# ISPW Assignments for {params.srid}", ""]
-            if params.level:
-                lines[0] += f" (Level: {params.level.value})"
-            lines.append(f"Found {total} assignment(s)\n")
-
-            for assignment in assignments:
-                lines.append(_format_assignment_markdown(assignment))
-
-            return "\n".join(lines)
-        else:
-            return json.dumps(data, indent=2)
+        header = f"# ISPW Assignments for {params.srid}"
+        if level:
+            header += f" (Level: {level})"
+        return f"{header}\n\nFound {total} assignment(s)\n\n" + "\n".join(
+            _format_assignment_markdown(assignment) for assignment in assignments
+        )
 
-    except Exception as e:
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -376,18 +576,22 @@ async def ispw_get_assignment(params: GetAssignmentInput) -> str:
         - Get assignment: srid="ISPW", assignment_id="PLAY000001"
     """
     try:
-        data = await _make_api_request(
-            f"ispw/{params.srid}/assignments/{params.assignment_id}"
+        raw = params.response_format is ResponseFormat.JSON
+        data, error = await _make_api_request(
+            f"{_assignments_url(params.srid)}/{params.assignment_id}",
+            raw=raw
         )
+        if error:
+            return error
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [f"# Assignment Details: {params.assignment_id}\n"]
-            lines.append(_format_assignment_markdown(data))
-            return "\n".join(lines)
-        else:
-            return json.dumps(data, indent=2)
+        if raw:
+            return data
 
-    except Exception as e:
+        lines = [f"# Assignment Details: {params.assignment_id}\n"]
+        lines.append(_format_assignment_markdown(data))
+        return "\n".join(lines)
+
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -425,32 +629,32 @@ async def ispw_create_assignment(params: CreateAssignmentInput) -> str:
           application="PLAY", description="New feature work"
     """
     try:
-        request_body = {
-            "assignmentId": params.assignment_id,
-            "stream": params.stream,
-            "application": params.application
-        }
-        if params.description:
-            request_body["description"] = params.description
-        if params.default_path:
-            request_body["defaultPath"] = params.default_path
-
-        data = await _make_api_request(
-            f"ispw/{params.srid}/assignments",
+        request_body = {key: value for key, value in (
+            ("assignmentId", params.assignment_id),
+            ("stream", params.stream),
+            ("application", params.application),
+            ("description", params.description),
+            ("defaultPath", params.default_path)
+        ) if value}
+
+        data, error = await _make_api_request(
+            _assignments_url(params.srid),
             method="POST",
             json_data=request_body
         )
+        if error:
+            return error
 
-        if params.response_format == ResponseFormat.MARKDOWN:
+        if params.response_format is ResponseFormat.MARKDOWN:
             lines = [
-                f"# Assignment Created Successfully\n",
+                "# Assignment Created Successfully\n",
                 _format_assignment_markdown(data)
             ]
             return "\n".join(lines)
         else:
-            return json.dumps(data, indent=2)
+            return _dump_json(data)
 
-    except Exception as e:
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -458,25 +662,11 @@ async def ispw_create_assignment(params: CreateAssignmentInput) -> str:
 # TASK TOOLS
 # ============================================================================
 
-class ListTasksInput(BaseModel):
+class ListTasksInput(_IspwBase):
     """Input model for listing assignment tasks."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier",
-        min_length=1,
-        max_length=50
-    )
-    assignment_id: str = Field(
+    assignment_id: _Identifier = Field(
         ...,
-        description="Assignment identifier",
-        min_length=1,
-        max_length=100
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format"
+        description="Assignment identifier"
     )
 
 
@@ -509,9 +699,16 @@ async def ispw_list_tasks(params: ListTasksInput) -> str:
         - List tasks: srid="ISPW", assignment_id="PLAY000001"
     """
     try:
-        data = await _make_api_request(
-            f"ispw/{params.srid}/assignments/{params.assignment_id}/tasks"
+        raw = params.response_format is ResponseFormat.JSON
+        data, error = await _make_api_request(
+            f"{_assignments_url(params.srid)}/{params.assignment_id}/tasks",
+            raw=raw
         )
+        if error:
+            return error
+
+        if raw:
+            return data
 
         tasks = data.get("tasks", [])
         total = data.get("totalCount", len(tasks))
@@ -519,21 +716,117 @@ async def ispw_list_tasks(params: ListTasksInput) -> str:
         if not tasks:
             return f"No tasks found for assignment '{params.assignment_id}'"
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                f"# Tasks for Assignment: {params.assignment_id}",
-                f"",
-                f"Found {total} task(s)\n"
-            ]
+        return f"# Tasks for Assignment: {params.assignment_id}\n\nFound {total} task(s)\n\n" + "\n".join(
+            _format_task_markdown(task) for task in tasks
+        )
 
-            for task in tasks:
-                lines.append(_format_task_markdown(task))
+    except _API_ERRORS as e:
+        return _handle_api_error(e)
 
-            return "\n".join(lines)
-        else:
-            return json.dumps(data, indent=2)
 
-    except Exception as e:
+class ListAssignmentsWithTasksInput(ListAssignmentsInput):
+    """Input model for listing assignments together with their tasks."""
+
+
+@mcp.tool(
+    name="ispw_list_assignments_with_tasks",
+    annotations={
+        "title": "List ISPW Assignments with Tasks",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False
+    }
+)
+async def ispw_list_assignments_with_tasks(params: ListAssignmentsWithTasksInput) -> str:
+    """List ISPW assignments for a specific SRID together with the tasks of each assignment.
+
+    Retrieves the matching assignments, then fetches the tasks for all of them concurrently.
+    Use this instead of calling ispw_list_tasks once per assignment.
+
+    Args:
+        params (ListAssignmentsWithTasksInput): Validated input parameters containing:
+            - srid (str): System Resource Identifier (default: from ISPW_DEFAULT_SRID env var)
+            - level (Optional[AssignmentLevel]): Filter by assignment level (DEV, INT, ACC, PRD)
+            - assignment_id (Optional[str]): Filter by specific assignment ID
+            - response_format (ResponseFormat): Output format (default: markdown)
+
+    Returns:
+        str: Formatted list of assignments and their tasks or error message
+
+    Examples:
+        - List DEV assignments with tasks: srid="ISPW", level="DEV"
+    """
+    try:
+        level = params.level.value if params.level else None
+        query_params = {}
+        if level:
+            query_params["level"] = level
+        if params.assignment_id:
+            query_params["assignmentId"] = params.assignment_id
+
+        data, error = await _make_api_request(
+            _assignments_url(params.srid),
+            params=query_params
+        )
+        if error:
+            return error
+
+        assignments = data.get("assignments", [])
+        total = data.get("totalCount", len(assignments))
+
+        if not assignments:
+            if params.response_format is ResponseFormat.JSON:
+                return _dump_json({"assignments": [], "totalCount": total})
+            filter_desc = " matching filters" if query_params else ""
+            return f"No assignments found{filter_desc} for SRID '{params.srid}'"
+
+        assignments_url = _assignments_url(params.srid)
+        assignment_ids = [assignment.get("assignmentId") for assignment in assignments]
+        results = iter(await _make_api_requests_batch([
+            {"endpoint": f"{assignments_url}/{assignment_id}/tasks"}
+            for assignment_id in assignment_ids if assignment_id
+        ]))
+
+        # Pair each assignment with (tasks, error) from its task lookup
+        task_results = []
+        for assignment_id in assignment_ids:
+            if not assignment_id:
+                task_results.append((None, "Error: Assignment has no assignmentId; tasks were not fetched."))
+                continue
+            result = next(results)
+            if isinstance(result, BaseException):
+                if not isinstance(result, _API_ERRORS):
+                    raise result
+                task_results.append((None, _handle_api_error(result)))
+            else:
+                tasks_data, tasks_error = result
+                task_results.append((None if tasks_error else tasks_data.get("tasks", []), tasks_error))
+
+        if params.response_format is ResponseFormat.MARKDOWN:
+            header = f"# ISPW Assignments with Tasks for {params.srid}"
+            if level:
+                header += f" (Level: {level})"
+            sections = []
+            for assignment, (tasks, tasks_error) in zip(assignments, task_results):
+                if tasks_error:
+                    tasks_md = f"{tasks_error}\n"
+                elif tasks:
+                    tasks_md = "\n".join(_format_task_markdown(task) for task in tasks)
+                else:
+                    tasks_md = "No tasks found\n"
+                sections.append(f"{_format_assignment_markdown(assignment)}\n{tasks_md}")
+            return f"{header}\n\nFound {total} assignment(s)\n\n" + "\n".join(sections)
+        else:
+            combined = []
+            for assignment, (tasks, tasks_error) in zip(assignments, task_results):
+                if tasks_error:
+                    combined.append({**assignment, "tasksError": tasks_error})
+                else:
+                    combined.append({**assignment, "tasks": tasks})
+            return _dump_json({"assignments": combined, "totalCount": total})
+
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -541,86 +834,41 @@ async def ispw_list_tasks(params: ListTasksInput) -> str:
 # RELEASE TOOLS
 # ============================================================================
 
-class ListReleasesInput(BaseModel):
+class ListReleasesInput(_IspwBase):
     """Input model for listing releases."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier",
-        min_length=1,
-        max_length=50
-    )
-    release_id: Optional[str] = Field(
+    release_id: Optional[_IdentifierFilter] = Field(
         default=None,
-        description="Filter by specific release ID",
-        max_length=100
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format"
+        description="Filter by specific release ID"
     )
 
 
-class GetReleaseInput(BaseModel):
+class GetReleaseInput(_IspwBase):
     """Input model for getting release details."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier",
-        min_length=1,
-        max_length=50
-    )
-    release_id: str = Field(
+    release_id: _Identifier = Field(
         ...,
-        description="Release identifier to retrieve",
-        min_length=1,
-        max_length=100
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format"
+        description="Release identifier to retrieve"
     )
 
 
-class CreateReleaseInput(BaseModel):
+class CreateReleaseInput(_IspwBase):
     """Input model for creating a release."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier",
-        min_length=1,
-        max_length=50
-    )
-    release_id: str = Field(
+    release_id: _Identifier = Field(
         ...,
-        description="Release identifier (must be unique)",
-        min_length=1,
-        max_length=100
+        description="Release identifier (must be unique)"
     )
-    stream: str = Field(
+    stream: _Identifier = Field(
         ...,
-        description="Stream name for the release",
-        min_length=1,
-        max_length=100
+        description="Stream name for the release"
     )
-    application: str = Field(
+    application: _Identifier = Field(
         ...,
-        description="Application name for the release",
-        min_length=1,
-        max_length=100
+        description="Application name for the release"
     )
     description: Optional[str] = Field(
         default=None,
         description="Release description",
         max_length=500
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format"
-    )
 
 
 @mcp.tool(
@@ -657,29 +905,30 @@ async def ispw_list_releases(params: ListReleasesInput) -> str:
         if params.release_id:
             query_params["releaseId"] = params.release_id
 
-        data = await _make_api_request(
-            f"ispw/{params.srid}/releases",
-            params=query_params
+        raw = params.response_format is ResponseFormat.JSON
+        data, error = await _make_api_request(
+            _releases_url(params.srid),
+            params=query_params,
+            raw=raw
         )
+        if error:
+            return error
+
+        if raw:
+            return data
 
         releases = data.get("releases", [])
         total = data.get("totalCount", len(releases))
 
         if not releases:
-            filter_desc = f" matching filter" if query_params else ""
+            filter_desc = " matching filter" if query_params else ""
             return f"No releases found{filter_desc} for SRID '{params.srid}'"
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [f"# ISPW Releases for {params.srid}", "", f"Found {total} release(s)\n"]
-
-            for release in releases:
-                lines.append(_format_release_markdown(release))
-
-            return "\n".join(lines)
-        else:
-            return json.dumps(data, indent=2)
+        return f"# ISPW Releases for {params.srid}\n\nFound {total} release(s)\n\n" + "\n".join(
+            _format_release_markdown(release) for release in releases
+        )
 
-    except Exception as e:
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -712,18 +961,22 @@ async def ispw_get_release(params: GetReleaseInput) -> str:
         - Get release: srid="ISPW", release_id="REL001"
     """
     try:
-        data = await _make_api_request(
-            f"ispw/{params.srid}/releases/{params.release_id}"
+        raw = params.response_format is ResponseFormat.JSON
+        data, error = await _make_api_request(
+            f"{_releases_url(params.srid)}/{params.release_id}",
+            raw=raw
         )
+        if error:
+            return error
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [f"# Release Details: {params.release_id}\n"]
-            lines.append(_format_release_markdown(data))
-            return "\n".join(lines)
-        else:
-            return json.dumps(data, indent=2)
+        if raw:
+            return data
 
-    except Exception as e:
+        lines = [f"# Release Details: {params.release_id}\n"]
+        lines.append(_format_release_markdown(data))
+        return "\n".join(lines)
+
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -760,30 +1013,31 @@ async def ispw_create_release(params: CreateReleaseInput) -> str:
           application="PLAY", description="Q1 2026 Release"
     """
     try:
-        request_body = {
-            "releaseId": params.release_id,
-            "stream": params.stream,
-            "application": params.application
-        }
-        if params.description:
-            request_body["description"] = params.description
-
-        data = await _make_api_request(
-            f"ispw/{params.srid}/releases",
+        request_body = {key: value for key, value in (
+            ("releaseId", params.release_id),
+            ("stream", params.stream),
+            ("application", params.application),
+            ("description", params.description)
+        ) if value}
+
+        data, error = await _make_api_request(
+            _releases_url(params.srid),
             method="POST",
             json_data=request_body
         )
+        if error:
+            return error
 
-        if params.response_format == ResponseFormat.MARKDOWN:
+        if params.response_format is ResponseFormat.MARKDOWN:
             lines = [
-                f"# Release Created Successfully\n",
+                "# Release Created Successfully\n",
                 _format_release_markdown(data)
             ]
             return "\n".join(lines)
         else:
-            return json.dumps(data, indent=2)
+            return _dump_json(data)
 
-    except Exception as e:
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -791,21 +1045,13 @@ async def ispw_create_release(params: CreateReleaseInput) -> str:
 # OPERATION TOOLS (Generate, Promote, Deploy)
 # ============================================================================
 
-class GenerateAssignmentInput(BaseModel):
+class GenerateAssignmentInput(_IspwBase):
     """Input model for generating an assignment."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
+    model_config = ConfigDict(use_enum_values=True)
 
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier",
-        min_length=1,
-        max_length=50
-    )
-    assignment_id: str = Field(
+    assignment_id: _Identifier = Field(
         ...,
-        description="Assignment identifier",
-        min_length=1,
-        max_length=100
+        description="Assignment identifier"
     )
     level: Optional[str] = Field(
         default=None,
@@ -817,27 +1063,15 @@ class GenerateAssignmentInput(BaseModel):
         description="Runtime configuration",
         max_length=100
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format"
-    )
 
 
-class PromoteAssignmentInput(BaseModel):
+class PromoteAssignmentInput(_IspwBase):
     """Input model for promoting an assignment."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
+    model_config = ConfigDict(use_enum_values=True)
 
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier",
-        min_length=1,
-        max_length=50
-    )
-    assignment_id: str = Field(
+    assignment_id: _Identifier = Field(
         ...,
-        description="Assignment identifier",
-        min_length=1,
-        max_length=100
+        description="Assignment identifier"
     )
     level: Optional[str] = Field(
         default=None,
@@ -853,32 +1087,19 @@ class PromoteAssignmentInput(BaseModel):
         description="Execution status",
         max_length=50
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format"
-    )
 
 
-class DeployInput(BaseModel):
+class DeployInput(_IspwBase):
     """Input model for deployment operations."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
+    model_config = ConfigDict(use_enum_values=True)
 
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier",
-        min_length=1,
-        max_length=50
-    )
-    target_id: str = Field(
+    target_id: _Identifier = Field(
         ...,
-        description="Assignment, release, or set identifier",
-        min_length=1,
-        max_length=100
+        description="Assignment, release, or set identifier"
     )
-    target_type: str = Field(
+    target_type: Literal["assignment", "release", "set"] = Field(
         ...,
-        description="Type of deployment: 'assignment', 'release', or 'set'",
-        pattern="^(assignment|release|set)$"
+        description="Type of deployment: 'assignment', 'release', or 'set'"
     )
     level: Optional[str] = Field(
         default=None,
@@ -894,10 +1115,6 @@ class DeployInput(BaseModel):
         default=None,
         description="Deploy to active libraries"
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format"
-    )
 
 
 @mcp.tool(
@@ -932,24 +1149,22 @@ async def ispw_generate_assignment(params: GenerateAssignmentInput) -> str:
         - Generate with level: srid="ISPW", assignment_id="PLAY000001", level="DEV"
     """
     try:
-        request_body = {}
-        if params.level:
-            request_body["level"] = params.level
-        if params.runtime_configuration:
-            request_body["runtimeConfiguration"] = params.runtime_configuration
-
-        data = await _make_api_request(
-            f"ispw/{params.srid}/assignments/{params.assignment_id}/generate",
+        request_body = {key: value for key, value in (
+            ("level", params.level),
+            ("runtimeConfiguration", params.runtime_configuration)
+        ) if value}
+
+        data, error = await _make_api_request(
+            f"{_assignments_url(params.srid)}/{params.assignment_id}/generate",
             method="POST",
             json_data=request_body
         )
+        if error:
+            return error
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            return _format_operation_markdown(data)
-        else:
-            return json.dumps(data, indent=2)
+        return _OPERATION_RENDERERS[params.response_format](data)
 
-    except Exception as e:
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -988,26 +1203,23 @@ async def ispw_promote_assignment(params: PromoteAssignmentInput) -> str:
           change_type="S"
     """
     try:
-        request_body = {}
-        if params.level:
-            request_body["level"] = params.level
-        if params.change_type:
-            request_body["changeType"] = params.change_type.value
-        if params.execution_status:
-            request_body["executionStatus"] = params.execution_status
-
-        data = await _make_api_request(
-            f"ispw/{params.srid}/assignments/{params.assignment_id}/promote",
+        request_body = {key: value for key, value in (
+            ("level", params.level),
+            ("changeType", params.change_type),
+            ("executionStatus", params.execution_status)
+        ) if value}
+
+        data, error = await _make_api_request(
+            f"{_assignments_url(params.srid)}/{params.assignment_id}/promote",
             method="POST",
             json_data=request_body
         )
+        if error:
+            return error
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            return _format_operation_markdown(data)
-        else:
-            return json.dumps(data, indent=2)
+        return _OPERATION_RENDERERS[params.response_format](data)
 
-    except Exception as e:
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -1049,36 +1261,25 @@ async def ispw_deploy(params: DeployInput) -> str:
           deploy_implementation_time="2026-01-15T10:00:00Z"
     """
     try:
-        request_body = {}
-        if params.level:
-            request_body["level"] = params.level
-        if params.deploy_implementation_time:
-            request_body["deployImplementationTime"] = params.deploy_implementation_time
+        request_body = {key: value for key, value in (
+            ("level", params.level),
+            ("deployImplementationTime", params.deploy_implementation_time)
+        ) if value}
         if params.deploy_active is not None:
             request_body["deployActive"] = params.deploy_active
 
-        # Determine endpoint based on target type
-        if params.target_type == "assignment":
-            endpoint = f"ispw/{params.srid}/assignments/{params.target_id}/deploy"
-        elif params.target_type == "release":
-            endpoint = f"ispw/{params.srid}/releases/{params.target_id}/deploy"
-        elif params.target_type == "set":
-            endpoint = f"ispw/{params.srid}/sets/{params.target_id}/deploy"
-        else:
-            return f"Error: Invalid target_type '{params.target_type}'. Must be 'assignment', 'release', or 'set'."
-
-        data = await _make_api_request(
-            endpoint,
+        # target_type is restricted to the _DEPLOY_ENDPOINTS keys by DeployInput validation
+        data, error = await _make_api_request(
+            f"{_DEPLOY_ENDPOINTS[params.target_type](params.srid)}/{params.target_id}/deploy",
             method="POST",
             json_data=request_body
         )
+        if error:
+            return error
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            return _format_operation_markdown(data)
-        else:
-            return json.dumps(data, indent=2)
+        return _OPERATION_RENDERERS[params.response_format](data)
 
-    except Exception as e:
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -1086,67 +1287,27 @@ async def ispw_deploy(params: DeployInput) -> str:
 # SET AND PACKAGE TOOLS
 # ============================================================================
 
-class ListSetsInput(BaseModel):
+class ListSetsInput(_IspwBase):
     """Input model for listing sets."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier",
-        min_length=1,
-        max_length=50
-    )
-    set_id: Optional[str] = Field(
+    set_id: Optional[_IdentifierFilter] = Field(
         default=None,
-        description="Filter by specific set ID",
-        max_length=100
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format"
+        description="Filter by specific set ID"
     )
 
 
-class ListPackagesInput(BaseModel):
+class ListPackagesInput(_IspwBase):
     """Input model for listing packages."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier",
-        min_length=1,
-        max_length=50
-    )
-    package_id: Optional[str] = Field(
+    package_id: Optional[_IdentifierFilter] = Field(
         default=None,
-        description="Filter by specific package ID",
-        max_length=100
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format"
+        description="Filter by specific package ID"
     )
 
 
-class GetPackageInput(BaseModel):
+class GetPackageInput(_IspwBase):
     """Input model for getting package details."""
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
-    srid: str = Field(
-        default=ISPW_DEFAULT_SRID,
-        description="System Resource Identifier",
-        min_length=1,
-        max_length=50
-    )
-    package_id: str = Field(
+    package_id: _Identifier = Field(
         ...,
-        description="Package identifier to retrieve",
-        min_length=1,
-        max_length=100
-    )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format"
+        description="Package identifier to retrieve"
     )
 
 
@@ -1184,34 +1345,30 @@ async def ispw_list_sets(params: ListSetsInput) -> str:
         if params.set_id:
             query_params["setId"] = params.set_id
 
-        data = await _make_api_request(
-            f"ispw/{params.srid}/sets",
-            params=query_params
+        raw = params.response_format is ResponseFormat.JSON
+        data, error = await _make_api_request(
+            _sets_url(params.srid),
+            params=query_params,
+            raw=raw
         )
+        if error:
+            return error
+
+        if raw:
+            return data
 
         sets = data.get("sets", [])
         total = data.get("totalCount", len(sets))
 
         if not sets:
-            filter_desc = f" matching filter" if query_params else ""
+            filter_desc = " matching filter" if query_params else ""
             return f"No sets found{filter_desc} for SRID '{params.srid}'"
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [f"# ISPW Sets for {params.srid}", "", f"Found {total} set(s)\n"]
-
-            for s in sets:
-                lines.append(f"## Set: {s.get('setId', 'N/A')}")
-                lines.append(f"- **Description**: {s.get('description', 'N/A')}")
-                lines.append(f"- **Owner**: {s.get('owner', 'N/A')}")
-                lines.append(f"- **Application**: {s.get('application', 'N/A')}")
-                lines.append(f"- **Status**: {s.get('status', 'N/A')}")
-                lines.append("")
+        if len(sets) > _OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(_format_sets_markdown, params.srid, sets, total)
+        return _format_sets_markdown(params.srid, sets, total)
 
-            return "\n".join(lines)
-        else:
-            return json.dumps(data, indent=2)
-
-    except Exception as e:
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -1249,35 +1406,30 @@ async def ispw_list_packages(params: ListPackagesInput) -> str:
         if params.package_id:
             query_params["packageId"] = params.package_id
 
-        data = await _make_api_request(
-            f"ispw/{params.srid}/packages",
-            params=query_params
+        raw = params.response_format is ResponseFormat.JSON
+        data, error = await _make_api_request(
+            _packages_url(params.srid),
+            params=query_params,
+            raw=raw
         )
+        if error:
+            return error
+
+        if raw:
+            return data
 
         packages = data.get("packages", [])
         total = data.get("totalCount", len(packages))
 
         if not packages:
-            filter_desc = f" matching filter" if query_params else ""
+            filter_desc = " matching filter" if query_params else ""
             return f"No packages found{filter_desc} for SRID '{params.srid}'"
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [f"# ISPW Packages for {params.srid}", "", f"Found {total} package(s)\n"]
-
-            for package in packages:
-                lines.append(f"## Package: {package.get('packageId', 'N/A')}")
-                lines.append(f"- **Description**: {package.get('description', 'N/A')}")
-                lines.append(f"- **Owner**: {package.get('owner', 'N/A')}")
-                lines.append(f"- **Application**: {package.get('application', 'N/A')}")
-                lines.append(f"- **Status**: {package.get('status', 'N/A')}")
-                lines.append(f"- **Created**: {_format_datetime(package.get('createdDate'))}")
-                lines.append("")
-
-            return "\n".join(lines)
-        else:
-            return json.dumps(data, indent=2)
+        if len(packages) > _OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(_format_packages_markdown, params.srid, packages, total)
+        return _format_packages_markdown(params.srid, packages, total)
 
-    except Exception as e:
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -1310,23 +1462,22 @@ async def ispw_get_package(params: GetPackageInput) -> str:
         - Get package: srid="ISPW", package_id="PKG001"
     """
     try:
-        data = await _make_api_request(
-            f"ispw/{params.srid}/packages/{params.package_id}"
+        raw = params.response_format is ResponseFormat.JSON
+        data, error = await _make_api_request(
+            f"{_packages_url(params.srid)}/{params.package_id}",
+            raw=raw
         )
+        if error:
+            return error
 
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [f"# Package Details: {params.package_id}\n"]
-            lines.append(f"## Package: {data.get('packageId', 'N/A')}")
-            lines.append(f"- **Description**: {data.get('description', 'N/A')}")
-            lines.append(f"- **Owner**: {data.get('owner', 'N/A')}")
-            lines.append(f"- **Application**: {data.get('application', 'N/A')}")
-            lines.append(f"- **Status**: {data.get('status', 'N/A')}")
-            lines.append(f"- **Created**: {_format_datetime(data.get('createdDate'))}")
-            return "\n".join(lines)
-        else:
-            return json.dumps(data, indent=2)
+        if raw:
+            return data
 
-    except Exception as e:
+        lines = [f"# Package Details: {params.package_id}\n"]
+        lines.append(_format_package_markdown(data))
+        return "\n".join(lines)
+
+    except _API_ERRORS as e:
         return _handle_api_error(e)
 
 
@@ -1334,6 +1485,21 @@ async def ispw_get_package(params: GetPackageInput) -> str:
 # SERVER ENTRY POINT
 # ============================================================================
 
+async def _serve() -> None:
+    """Run the server over stdio, closing the shared HTTP client when it stops.
+
+    The client is closed here, once per process, rather than in a FastMCP lifespan:
+    FastMCP enters its lifespan once per Server.run, which is once per session (SSE,
+    stateful streamable-http) or once per request (stateless streamable-http), and
+    closing there would drop the pooled connections between calls. Hosts that mount
+    the SSE or streamable-http app themselves should await _close_client() on shutdown.
+    """
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await _close_client()
+
+
 def main():
     """Main entry point for the ISPW MCP server."""
     # Check if required environment variable is set
@@ -1341,7 +1507,7 @@ def main():
         print("Warning: ISPW_API_TOKEN environment variable not set.")
         print("Please set it in your .env file or environment before using the server.")
 
-    mcp.run()
+    asyncio.run(_serve())
 
 
 if __name__ == "__main__":
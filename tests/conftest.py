@@ -0,0 +1,27 @@
+"""Shared fixtures for the ISPW MCP server tests."""
+
+from typing import Callable
+
+import httpx
+import pytest
+
+import ispw_mcp_server as server
+
+
+@pytest.fixture
+async def mock_api(monkeypatch):
+    """Route the shared HTTP client through an httpx.MockTransport.
+
+    Yields a function that installs a request handler; the client is closed after the test.
+    """
+    monkeypatch.setattr(server, "ISPW_API_TOKEN", "test-token")
+
+    def install(handler: Callable[[httpx.Request], httpx.Response]) -> None:
+        server._client = httpx.AsyncClient(
+            base_url=server.ISPW_BASE_URL,
+            transport=httpx.MockTransport(handler),
+            headers=server._BASE_HEADERS
+        )
+
+    yield install
+    await server._close_client()
@@ -0,0 +1,23 @@
+"""Tests for markdown formatting helpers."""
+
+import pytest
+
+from ispw_mcp_server import _format_assignment_markdown, _format_datetime
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2026-01-01T10:00:00Z", "2026-01-01 10:00:00 UTC"),
+    ("not-a-date", "not-a-date"),
+    (None, "N/A"),
+    ("", "N/A"),
+    ({"epoch": 1767261600}, "{'epoch': 1767261600}"),
+    (["2026-01-01"], "['2026-01-01']"),
+])
+def test_format_datetime(value, expected):
+    assert _format_datetime(value) == expected
+
+
+def test_unhashable_timestamp_does_not_fail_formatting():
+    text = _format_assignment_markdown({"assignmentId": "PLAY000001", "createdDate": {"epoch": 1767261600}})
+
+    assert "- **Created**: {'epoch': 1767261600}" in text
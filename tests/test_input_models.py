@@ -0,0 +1,30 @@
+"""Tests for tool input model validation."""
+
+import pytest
+from pydantic import ValidationError
+
+from ispw_mcp_server import CreateAssignmentInput, CreateReleaseInput
+
+
+@pytest.mark.parametrize("model, id_field", [
+    (CreateAssignmentInput, "assignment_id"),
+    (CreateReleaseInput, "release_id"),
+])
+def test_create_inputs_strip_stream_and_application(model, id_field):
+    params = model(**{id_field: " PLAY000001 "}, stream=" PLAY ", application=" PLAY ")
+
+    assert getattr(params, id_field) == "PLAY000001"
+    assert params.stream == "PLAY"
+    assert params.application == "PLAY"
+
+
+@pytest.mark.parametrize("model, id_field", [
+    (CreateAssignmentInput, "assignment_id"),
+    (CreateReleaseInput, "release_id"),
+])
+@pytest.mark.parametrize("field", ["stream", "application"])
+def test_create_inputs_reject_blank_codes(model, id_field, field):
+    values = {id_field: "PLAY000001", "stream": "PLAY", "application": "PLAY", field: "   "}
+
+    with pytest.raises(ValidationError):
+        model(**values)
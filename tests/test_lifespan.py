@@ -0,0 +1,20 @@
+"""Tests for the shared HTTP client lifecycle."""
+
+import ispw_mcp_server as server
+
+
+async def test_client_is_shared_across_calls_and_closed_on_shutdown(monkeypatch):
+    clients = []
+
+    async def run_stdio_async():
+        clients.append(server._get_client())
+        clients.append(server._get_client())
+
+    monkeypatch.setattr(server.mcp, "run_stdio_async", run_stdio_async)
+
+    await server._serve()
+
+    first, second = clients
+    assert first is second
+    assert first.is_closed
+    assert server._client is None
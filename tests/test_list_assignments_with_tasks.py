@@ -0,0 +1,143 @@
+"""Tests for the ispw_list_assignments_with_tasks composite tool."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import ispw_mcp_server as server
+from ispw_mcp_server import ListAssignmentsWithTasksInput, ispw_list_assignments_with_tasks
+
+ASSIGNMENTS = [
+    {"assignmentId": "PLAY000001", "description": "First", "level": "DEV"},
+    {"assignmentId": "PLAY000002", "description": "Second", "level": "DEV"},
+]
+TASKS = {
+    "PLAY000001": [{"taskId": "T1", "moduleName": "PROG1", "moduleType": "COB"}],
+    "PLAY000002": [{"taskId": "T2", "moduleName": "PROG2", "moduleType": "COB"}],
+}
+
+
+def make_handler(assignments, missing=()):
+    """Build a handler serving the given assignments; task lookups for `missing` return 404."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/assignments"):
+            return httpx.Response(200, json={"assignments": assignments, "totalCount": len(assignments)})
+        assignment_id = path.split("/")[-2]
+        if assignment_id in missing:
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json={"tasks": TASKS.get(assignment_id, [])})
+    return handler
+
+
+async def test_all_task_lookups_succeed(mock_api):
+    mock_api(make_handler(ASSIGNMENTS))
+
+    result = await ispw_list_assignments_with_tasks(ListAssignmentsWithTasksInput(response_format="json"))
+
+    data = json.loads(result)
+    assert data["totalCount"] == 2
+    assert [a["tasks"] for a in data["assignments"]] == [TASKS["PLAY000001"], TASKS["PLAY000002"]]
+    assert all("tasksError" not in a for a in data["assignments"])
+
+
+async def test_one_task_lookup_not_found(mock_api):
+    mock_api(make_handler(ASSIGNMENTS, missing={"PLAY000002"}))
+
+    result = await ispw_list_assignments_with_tasks(ListAssignmentsWithTasksInput(response_format="json"))
+
+    first, second = json.loads(result)["assignments"]
+    assert first["tasks"] == TASKS["PLAY000001"]
+    assert "tasks" not in second
+    assert second["tasksError"] == server._STATUS_ERROR_MESSAGES[404]
+
+
+async def test_one_task_lookup_not_found_markdown(mock_api):
+    mock_api(make_handler(ASSIGNMENTS, missing={"PLAY000002"}))
+
+    result = await ispw_list_assignments_with_tasks(ListAssignmentsWithTasksInput())
+
+    assert "### Task: T1" in result
+    assert server._STATUS_ERROR_MESSAGES[404] in result
+
+
+async def test_no_assignments(mock_api):
+    mock_api(make_handler([]))
+
+    result = await ispw_list_assignments_with_tasks(ListAssignmentsWithTasksInput())
+
+    assert result == "No assignments found for SRID 'ISPW'"
+
+
+async def test_no_assignments_json(mock_api):
+    mock_api(make_handler([]))
+
+    result = await ispw_list_assignments_with_tasks(ListAssignmentsWithTasksInput(response_format="json"))
+
+    assert json.loads(result) == {"assignments": [], "totalCount": 0}
+
+
+async def test_assignment_without_id_is_not_fetched(mock_api):
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        return make_handler([ASSIGNMENTS[0], {"description": "No ID"}])(request)
+
+    mock_api(handler)
+
+    result = await ispw_list_assignments_with_tasks(ListAssignmentsWithTasksInput(response_format="json"))
+
+    first, second = json.loads(result)["assignments"]
+    assert first["tasks"] == TASKS["PLAY000001"]
+    assert "assignmentId" in second["tasksError"]
+    assert not any("None" in path for path in requested)
+
+
+async def test_task_lookups_respect_concurrency_cap(mock_api):
+    assignments = [{"assignmentId": f"PLAY{i:06d}"} for i in range(server._BATCH_CONCURRENCY * 3)]
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        if request.url.path.endswith("/assignments"):
+            return httpx.Response(200, json={"assignments": assignments})
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"tasks": []})
+
+    mock_api(handler)
+
+    await ispw_list_assignments_with_tasks(ListAssignmentsWithTasksInput(response_format="json"))
+
+    assert peak == server._BATCH_CONCURRENCY
+
+
+async def test_task_lookup_timeout_is_reported(mock_api):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/assignments"):
+            return httpx.Response(200, json={"assignments": ASSIGNMENTS[:1]})
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    mock_api(handler)
+
+    result = await ispw_list_assignments_with_tasks(ListAssignmentsWithTasksInput(response_format="json"))
+
+    assert "timed out" in json.loads(result)["assignments"][0]["tasksError"]
+
+
+async def test_task_lookup_bug_propagates(mock_api):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/assignments"):
+            return httpx.Response(200, json={"assignments": ASSIGNMENTS[:1]})
+        raise RuntimeError("handler bug")
+
+    mock_api(handler)
+
+    with pytest.raises(RuntimeError, match="handler bug"):
+        await ispw_list_assignments_with_tasks(ListAssignmentsWithTasksInput())
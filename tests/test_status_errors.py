@@ -0,0 +1,47 @@
+"""Tests for mapping non-2xx ISPW API responses to error messages."""
+
+import httpx
+import pytest
+
+import ispw_mcp_server as server
+from ispw_mcp_server import GetAssignmentInput, ispw_get_assignment
+
+
+def respond_with(status_code, body=None):
+    """Build a handler that answers every request with the given status and JSON body."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, json=body if body is not None else {})
+    return handler
+
+
+async def test_bad_request_includes_server_message(mock_api):
+    mock_api(respond_with(400, {"error": {"message": "Invalid level"}}))
+
+    result = await ispw_get_assignment(GetAssignmentInput(assignment_id="PLAY000001"))
+
+    assert result == "Error: Bad request - Invalid level"
+
+
+async def test_bad_request_with_unparseable_body(mock_api):
+    mock_api(lambda request: httpx.Response(400, content=b"not json"))
+
+    result = await ispw_get_assignment(GetAssignmentInput(assignment_id="PLAY000001"))
+
+    assert result == "Error: Bad request. Check your input parameters."
+
+
+@pytest.mark.parametrize("status_code", [401, 403, 404, 429])
+async def test_mapped_status_codes(mock_api, status_code):
+    mock_api(respond_with(status_code))
+
+    result = await ispw_get_assignment(GetAssignmentInput(assignment_id="PLAY000001"))
+
+    assert result == server._STATUS_ERROR_MESSAGES[status_code]
+
+
+async def test_unmapped_server_error(mock_api):
+    mock_api(respond_with(503))
+
+    result = await ispw_get_assignment(GetAssignmentInput(assignment_id="PLAY000001", response_format="json"))
+
+    assert result == "Error: API request failed with status 503"